@@ -9,6 +9,13 @@ from app.models.database import User
 from app.services.auth_service import hash_password
 from datetime import datetime
 
+# Demo accounts: (username, email, password, role)
+DEMO_ACCOUNTS = [
+    ("trainee_demo", "trainee@demo.local", "password123", "trainee"),
+    ("trainer_demo", "trainer@demo.local", "password123", "trainer"),
+    ("admin", "admin@demo.local", "admin123", "admin"),
+]
+
 def seed_demo_accounts():
     """Create demo accounts if they don't exist"""
     # First, initialize database tables
@@ -19,53 +26,29 @@ def seed_demo_accounts():
     try:
         now = datetime.utcnow()
         
-        # Check and create trainee_demo
-        existing = db.query(User).filter(User.username == "trainee_demo").first()
-        if not existing:
-            trainee = User(
-                username="trainee_demo",
-                email="trainee@demo.local",
-                password_hash=hash_password("password123"),
-                role="trainee",
-                is_active=True,
-                is_banned=False,
-                created_at=now,
-                last_login=now
-            )
-            db.add(trainee)
-            print("[OK] Created demo account: trainee_demo / password123")
-        
-        # Check and create trainer_demo
-        existing = db.query(User).filter(User.username == "trainer_demo").first()
-        if not existing:
-            trainer = User(
-                username="trainer_demo",
-                email="trainer@demo.local",
-                password_hash=hash_password("password123"),
-                role="trainer",
-                is_active=True,
-                is_banned=False,
-                created_at=now,
-                last_login=now
-            )
-            db.add(trainer)
-            print("[OK] Created demo account: trainer_demo / password123")
+        # Check all demo usernames in one query
+        usernames = [username for username, _, _, _ in DEMO_ACCOUNTS]
+        existing = {
+            row.username
+            for row in db.query(User.username).filter(User.username.in_(usernames)).all()
+        }
         
-        # Check and create admin
-        existing = db.query(User).filter(User.username == "admin").first()
-        if not existing:
-            admin = User(
-                username="admin",
-                email="admin@demo.local",
-                password_hash=hash_password("admin123"),
-                role="admin",
+        for username, email, password, role in DEMO_ACCOUNTS:
+            if username in existing:
+                continue
+            # Only hash for accounts we actually create (hashing is slow on purpose)
+            user = User(
+                username=username,
+                email=email,
+                password_hash=hash_password(password),
+                role=role,
                 is_active=True,
                 is_banned=False,
                 created_at=now,
                 last_login=now
             )
-            db.add(admin)
-            print("[OK] Created demo account: admin / admin123")
+            db.add(user)
+            print(f"[OK] Created demo account: {username} / {password}")
         
         db.commit()
         print("\n[OK] Demo accounts seeded successfully!")
@@ -92,12 +92,19 @@ Stamina > 1200: Target speed buff = sqrt(Stamina-1200) × 0.0085 × DistFactor
 # DO NOT REMOVE THIS BLOCK - Used for ownership verification
 # If you see this in stolen code: search for "URS-RACE-ENGINE-2026-WMIRQ"
 
+import heapq
 import random
 import math
+import sys
+from bisect import bisect_right
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple, Set
 
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Import skills system
 try:
     from skills import (
@@ -161,7 +168,7 @@ class PositionKeepMode(Enum):
     PACE_UP_EX = "pace_up_ex"   # All: 2.0x target speed (wrong strategy order)
 
 
-# Position keep mode target speed modifiers
+# Position keep mode target speed modifiers (covers every mode - index directly)
 POSITION_KEEP_SPEED_MODIFIERS = {
     PositionKeepMode.NORMAL: 1.0,
     PositionKeepMode.SPEED_UP: 1.04,
@@ -222,7 +229,7 @@ class RunningStyleConfig:
     hp_recovery_bonus: float      # Bonus to HP recovery (EC/LS get more)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UmaState:
     """Runtime state for a single Uma during race"""
     name: str
@@ -234,6 +241,7 @@ class UmaState:
     lane: int = 0
     is_blocked: bool = False
     in_final_spurt: bool = False
+    final_spurt_guts_bonus: float = 0.0  # Guts target speed bonus, set on final spurt entry
     is_finished: bool = False
     is_dnf: bool = False
     dnf_reason: str = ""
@@ -254,6 +262,7 @@ class UmaState:
     position_keep_active: bool = True   # Active until mid-Mid-Race
     position_keep_cooldown: float = 0.0 # Cooldown before next mode check
     position_keep_duration: float = 0.0 # How long in current mode
+    pace_target: str = ""             # Name of the pacemaker selected at race start
     
     # LANE SYSTEM (NEW)
     lane_position: float = 0.0        # Actual lane position (0 = inner fence, in course width units)
@@ -851,6 +860,78 @@ DOWNHILL_ACCEL_MODE_THRESHOLD = -0.3  # Slope % to trigger downhill accel mode
 DOWNHILL_ACCEL_EXTRA_SPEED = 0.3      # Extra m/s allowed above target speed
 
 
+def build_slope_table(racecourse: str, race_distance: float, surface: str) -> List[float]:
+    """
+    Resolve COURSE_SLOPES for one course into a per-meter slope table.
+    
+    Slope segment bounds are whole meters, so table[int(distance)] gives the
+    same slope as scanning the segments. Earlier segments win on overlap.
+    Courses without slope data get an empty table (= flat).
+    """
+    slopes = COURSE_SLOPES.get(racecourse, {}).get((int(race_distance), surface), [])
+    if not slopes:
+        return []
+    
+    # Store plain floats so per-tick slope math never mixes int/float operands
+    table = [0.0] * (max(end_m for _, end_m, _ in slopes) + 1)
+    for start_m, end_m, slope in reversed(slopes):
+        table[start_m:end_m] = [float(slope)] * (end_m - start_m)
+    return table
+
+
+# Out-of-HP deceleration (m/s²) by phase, scaled by running style
+OUT_OF_HP_DECEL_RATES = {
+    RacePhase.START: 1.2,        # Opening phase: -1.2 m/s²
+    RacePhase.MIDDLE: 0.8,       # Middle phase: -0.8 m/s²
+    RacePhase.LATE: 1.0,         # Final phase: -1.0 m/s²
+    RacePhase.FINAL_SPURT: 1.0,
+}
+
+OUT_OF_HP_DECEL_STYLE_MULT = {
+    RunningStyle.RW: 1.1,  # Faster decel for front runners
+    RunningStyle.FR: 1.1,
+    RunningStyle.PC: 1.0,
+    RunningStyle.LS: 0.9,  # Slower decel for late runners
+    RunningStyle.EC: 0.9,
+}
+
+
+def advance_speed(current_speed: float, speed_cap: float, acceleration: float,
+                  minimum_speed: float, decel_rate: float, downhill_accel: bool,
+                  delta_time: float) -> float:
+    """
+    Advance an Uma's current speed by one tick.
+    
+    Plain float arithmetic only (no engine/state access), so the per-tick
+    speed update is a self-contained kernel.
+    
+    Args:
+        decel_rate: Out-of-HP deceleration (m/s²); 0 = still has HP
+        downhill_accel: Downhill accel mode (may exceed the speed cap)
+    
+    Returns: new current speed (never below minimum_speed)
+    """
+    if decel_rate > 0.0:
+        # Out of HP: decelerate to minimum speed
+        if current_speed > minimum_speed:
+            current_speed = max(minimum_speed, current_speed - decel_rate * delta_time)
+    else:
+        # Normal movement: accelerate toward target speed
+        # Downhill accel mode can exceed target speed
+        effective_cap = speed_cap
+        if downhill_accel:
+            effective_cap += DOWNHILL_ACCEL_EXTRA_SPEED
+        
+        if current_speed < effective_cap:
+            current_speed = min(effective_cap, current_speed + acceleration * delta_time)
+        elif current_speed > speed_cap:
+            # Decelerate if above cap (slower than acceleration)
+            current_speed = max(speed_cap, current_speed - 0.5 * delta_time)
+    
+    # Enforce minimum speed floor
+    return max(current_speed, minimum_speed)
+
+
 # =============================================================================
 # TEMPTATION SYSTEM (かかり) - Uncontrolled acceleration
 # =============================================================================
@@ -871,6 +952,11 @@ TEMPTATION_MAX_TRIGGERS = 1           # Max times temptation can trigger per rac
 TEMPTATION_COOLDOWN = 8.0             # Cooldown after temptation ends
 
 
+# Sort keys for ranking Uma states by distance covered / result tuples by value
+_BY_DISTANCE = attrgetter('distance')
+_BY_SECOND = itemgetter(1)
+
+
 # =============================================================================
 # BLOCKING SYSTEM CONSTANTS (from wiki)
 # =============================================================================
@@ -887,6 +973,12 @@ SIDE_BLOCK_LANE_THRESHOLD = 2.0  # horse lane units
 OVERLAP_BUMP_GAP_THRESHOLD = 0.4  # meters
 OVERLAP_BUMP_LANE_THRESHOLD = 0.4  # horse lane units
 
+# Squared thresholds (compare squared diffs instead of abs() per pair)
+SIDE_BLOCK_GAP_SQ = SIDE_BLOCK_GAP_THRESHOLD ** 2
+SIDE_BLOCK_LANE_SQ = (SIDE_BLOCK_LANE_THRESHOLD * HORSE_LANE) ** 2
+OVERLAP_BUMP_GAP_SQ = OVERLAP_BUMP_GAP_THRESHOLD ** 2
+OVERLAP_BUMP_LANE_SQ = (OVERLAP_BUMP_LANE_THRESHOLD * HORSE_LANE) ** 2
+
 # Blocked speed cap formula: (0.988 + 0.012 * gap/2) * blocker_speed
 BLOCKED_SPEED_BASE = 0.988
 BLOCKED_SPEED_GAP_FACTOR = 0.012
@@ -926,6 +1018,7 @@ STAMINA_KEEP_MAX_BEHIND = 3.0        # meters behind pacemaker to activate
 
 # Target distance behind pacemaker (leader) by running style
 # Non-FR runners maintain position relative to the pacemaker
+# Covers every RunningStyle, so it is indexed directly (no .get fallback)
 PACEMAKER_TARGET_DISTANCE = {
     RunningStyle.FR: 0.0,    # FR aims to BE the pacemaker
     RunningStyle.RW: 0.0,    # RW also aims to be pacemaker
@@ -942,6 +1035,21 @@ PACEMAKER_TOO_FAR = 3.0      # meters - trigger PACE_UP if farther than (target
 FR_TARGET_LEAD = 4.5         # meters ahead FR wants to be
 FR_SPEED_UP_GAP = 2.0        # If lead < this, SPEED_UP triggers
 
+# Position keep transition table: situation -> (mode_on_roll, roll_chance, mode_otherwise)
+# roll_chance is scaled by the wisdom factor; 0.0 = no roll, always mode_otherwise
+POSITION_KEEP_TRANSITIONS = {
+    # FR/RW: we ARE the pacemaker
+    'lead_threatened': (PositionKeepMode.SPEED_UP, 0.5, PositionKeepMode.NORMAL),   # 2nd place too close
+    'lead_safe':       (PositionKeepMode.NORMAL, 0.0, PositionKeepMode.NORMAL),
+    # FR/RW: we're NOT the pacemaker - need to catch up
+    'chasing_far':     (PositionKeepMode.OVERTAKE, 0.4, PositionKeepMode.SPEED_UP),
+    'chasing_close':   (PositionKeepMode.SPEED_UP, 0.3, PositionKeepMode.NORMAL),
+    # Non-FR (PC/LS/EC): follow the pacemaker
+    'too_close':       (PositionKeepMode.PACE_DOWN, 0.4, PositionKeepMode.NORMAL),
+    'too_far':         (PositionKeepMode.PACE_UP, 0.3, PositionKeepMode.NORMAL),
+    'in_position':     (PositionKeepMode.NORMAL, 0.0, PositionKeepMode.NORMAL),
+}
+
 
 # =============================================================================
 # LIMIT BREAK CONSTANTS (from wiki)
@@ -1147,11 +1255,12 @@ class AccelMode(Enum):
     PUSHING = auto()      # Aggressive, faster but more HP drain
     SPRINTING = auto()    # Maximum effort, final spurt
 
+# (speed, accel, hp) multipliers per mode
 ACCEL_MODE_MODIFIERS = {
-    AccelMode.CONSERVING: {'speed': 0.97, 'accel': 0.9, 'hp': 0.85},   # -3% speed, -10% accel, -15% HP drain
-    AccelMode.CRUISING: {'speed': 1.0, 'accel': 1.0, 'hp': 1.0},       # Normal
-    AccelMode.PUSHING: {'speed': 1.02, 'accel': 1.1, 'hp': 1.15},      # +2% speed, +10% accel, +15% HP drain
-    AccelMode.SPRINTING: {'speed': 1.04, 'accel': 1.2, 'hp': 1.25},    # +4% speed, +20% accel, +25% HP drain
+    AccelMode.CONSERVING: (0.97, 0.9, 0.85),  # -3% speed, -10% accel, -15% HP drain
+    AccelMode.CRUISING: (1.0, 1.0, 1.0),      # Normal
+    AccelMode.PUSHING: (1.02, 1.1, 1.15),     # +2% speed, +10% accel, +15% HP drain
+    AccelMode.SPRINTING: (1.04, 1.2, 1.25),   # +4% speed, +20% accel, +25% HP drain
 }
 
 
@@ -1179,6 +1288,36 @@ SKILL_MAX_ACTIVATION_RATE = 0.95      # Max 95% activation rate
 SKILL_CONDITION_BONUS = 0.1           # +10% when conditions are perfect
 
 
+# =============================================================================
+# SKILL CONDITION LOOKUPS
+# =============================================================================
+# Skill requirement enums -> engine values they must match
+
+if SKILLS_AVAILABLE:
+    SKILL_PHASE_REQUIREMENTS = {  # SECOND_HALF is progress-based, checked separately
+        SkillTriggerPhase.EARLY: RacePhase.START,
+        SkillTriggerPhase.MID: RacePhase.MIDDLE,
+        SkillTriggerPhase.LATE: RacePhase.LATE,
+        SkillTriggerPhase.LAST_SPURT: RacePhase.FINAL_SPURT,
+    }
+    SKILL_STYLE_REQUIREMENTS = {
+        RunningStyleRequirement.FR: RunningStyle.FR,
+        RunningStyleRequirement.PC: RunningStyle.PC,
+        RunningStyleRequirement.LS: RunningStyle.LS,
+        RunningStyleRequirement.EC: RunningStyle.EC,
+    }
+    SKILL_RACE_TYPE_REQUIREMENTS = {
+        RaceTypeRequirement.SPRINT: "Sprint",
+        RaceTypeRequirement.MILE: "Mile",
+        RaceTypeRequirement.MEDIUM: "Medium",
+        RaceTypeRequirement.LONG: "Long",
+    }
+else:
+    SKILL_PHASE_REQUIREMENTS = {}
+    SKILL_STYLE_REQUIREMENTS = {}
+    SKILL_RACE_TYPE_REQUIREMENTS = {}
+
+
 # =============================================================================
 # RECOVERY SKILL CONSTANTS (NEW)
 # =============================================================================
@@ -1251,7 +1390,7 @@ TERRAIN_STAT_PENALTIES = {
 }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActiveSkillState:
     """Runtime state for an active skill effect"""
     skill_id: str
@@ -1262,7 +1401,7 @@ class ActiveSkillState:
     stamina_save: float = 0.0  # Percentage reduction in HP consumption
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UmaStats:
     """Static stats for a single Uma"""
     name: str
@@ -1342,6 +1481,10 @@ PHASE_CONFIGS = {
     RacePhase.FINAL_SPURT: {'start': 5 * SIXTH, 'end': 1.0}, # Sections 21-24
 }
 
+# Phase lookup by bisecting progress against the phase start boundaries
+PHASE_ORDER = (RacePhase.START, RacePhase.MIDDLE, RacePhase.LATE, RacePhase.FINAL_SPURT)
+PHASE_THRESHOLDS = [PHASE_CONFIGS[phase]['start'] for phase in PHASE_ORDER[1:]]
+
 
 # =============================================================================
 # RUNNING STYLE CONFIGURATIONS (simplified for simulation)
@@ -1589,9 +1732,30 @@ class RaceEngine:
         
         self.uma_states: Dict[str, UmaState] = {}
         self.uma_stats: Dict[str, UmaStats] = {}
+        self._dnf_risks: Dict[str, Tuple[Tuple[str, float], ...]] = {}  # Uma name -> (reason, chance) per critical stat
+        self._applicable_skills: Dict[str, Dict[RacePhase, List[Tuple[str, 'Skill']]]] = {}  # Uma name -> phase -> (skill_id, skill) that can match
+        self._effective_styles: Dict[str, RunningStyle] = {}  # Uma name -> effective running style
+        self._base_speed_caps: Dict[Tuple[str, RacePhase], float] = {}  # (Uma name, phase) -> base target speed
+        # Field arrays by index (uma_states order); names only matter at the API boundary
+        self._names: List[str] = []
+        self._states: List[UmaState] = []
+        self._uma_bits: Dict[str, int] = {}  # Uma name -> 1 << field index (uma_states order)
+        self._alive_bits: int = 0  # Bit set per Uma still running (see retire_uma)
+        self._dnf_count: int = 0  # Umas that have DNF'd (field size for position checks)
+        self._leader_name: Optional[str] = None  # Cached pacemaker (see get_leader)
+        self._leader_valid: bool = False
         self.current_time: float = 0.0
         self.is_finished: bool = False
         
+        # Slope lookup table for this course (constant for the whole race)
+        self._surface_str = "Turf" if terrain == TerrainType.TURF else "Dirt"
+        self._slope_table: List[float] = build_slope_table(racecourse, race_distance, self._surface_str)
+        
+        # Race-constant progress values (avoid per-tick divisions)
+        self._inv_race_distance = 1.0 / race_distance
+        self._before_spurt_start = 5/6 - BEFORE_SPURT_DISTANCE / race_distance  # Compete Before Spurt window
+        self._start_dash_threshold = 0.85 * self.base_speed  # Start dash ends at 0.85 x BaseSpeed
+        
         # Position keep ends at mid-Mid-Race (0.5 * 4/6 = 2/6 = 1/3 of race)
         self.position_keep_end = (1/6 + 0.5 * 3/6) * race_distance  # ~41.67% of race
         
@@ -1628,26 +1792,24 @@ class RaceEngine:
             uma_or_stats: Either uma_name (str) or UmaStats object
         
         Returns: RunningStyle (RW if FR+Runaway, otherwise their actual style)
+        
+        Resolved once per Uma in add_uma and served from cache afterwards.
         """
         if isinstance(uma_or_stats, str):
+            cached = self._effective_styles.get(uma_or_stats)
+            if cached is not None:
+                return cached
             stats = self.uma_stats[uma_or_stats]
-            uma_name = uma_or_stats
         else:
             stats = uma_or_stats
-            # Need to find uma_name from stats for has_runaway_skill
-            uma_name = None
-            for name, s in self.uma_stats.items():
-                if s is stats:
-                    uma_name = name
-                    break
-        
-        if stats.running_style == RunningStyle.FR:
-            if uma_name and self.has_runaway_skill(uma_name):
-                return RunningStyle.RW  # Treat as Runaway internally
-            elif isinstance(uma_or_stats, UmaStats):
-                # Check directly from stats.skills
-                if "runaway" in [s.lower() for s in stats.skills]:
-                    return RunningStyle.RW
+            # Registered Uma: use the style cached in add_uma
+            if self.uma_stats.get(stats.name) is stats:
+                cached = self._effective_styles.get(stats.name)
+                if cached is not None:
+                    return cached
+        
+        if stats.running_style == RunningStyle.FR and self.has_runaway_skill(stats):
+            return RunningStyle.RW  # Treat as Runaway internally
         return stats.running_style
 
     def apply_stat_diminishing_returns(self, stat_value: int) -> float:
@@ -1874,6 +2036,11 @@ class RaceEngine:
     def add_uma(self, stats: UmaStats, racecourse: str = "Tokyo") -> None:
         """Add an Uma to the race with initial state including all new mechanics."""
         self.uma_stats[stats.name] = stats
+        # Effective style never changes during a race - resolve it once
+        self._effective_styles.pop(stats.name, None)
+        for phase in PHASE_ORDER:
+            self._base_speed_caps.pop((stats.name, phase), None)
+        self._effective_styles[stats.name] = self.get_effective_running_style(stats)
         max_hp = self.calculate_max_hp(stats)
         
         # Generate start delay (GameTora mechanic)
@@ -1934,6 +2101,38 @@ class RaceEngine:
             stamina_limit_break_bonus=stamina_limit_break_bonus,
         )
         self.uma_states[stats.name] = state
+        self._dnf_risks[stats.name] = self.calculate_dnf_risks(stats)
+        self._applicable_skills[stats.name] = self.group_skills_by_phase(self.get_applicable_skills(stats))
+        if stats.name not in self._uma_bits:
+            self._uma_bits[stats.name] = 1 << len(self._uma_bits)
+        self._alive_bits |= self._uma_bits[stats.name]
+        self.rebuild_field()
+        self._leader_valid = False
+        
+    def calculate_dnf_risks(self, stats: UmaStats) -> Tuple[Tuple[str, float], ...]:
+        """
+        Precompute the per-check DNF chance for each CRITICALLY low stat (<100).
+        
+        Effective stats don't change during a race, so this is done once in
+        add_uma. Most Uma have no critical stats and get an empty tuple,
+        which lets check_dnf skip the stat work entirely.
+        """
+        critical_stats = [
+            (stats.stamina, "exhaustion"),
+            (stats.guts, "gave_up"),
+            (stats.power, "injury"),
+        ]
+        
+        risks = []
+        for stat_value, reason in critical_stats:
+            effective_stat = self.get_effective_stat(stat_value)
+            # Only trigger if BELOW 100 (critical threshold)
+            if effective_stat < self.CRITICAL_STAT_THRESHOLD:
+                # Lower stat = higher chance, but still very rare
+                stat_deficit = self.CRITICAL_STAT_THRESHOLD - effective_stat
+                dnf_multiplier = stat_deficit / 100.0  # 0.0 at 100, 1.0 at 0
+                risks.append((reason, self.DNF_CHANCE_PER_TICK * (1.0 + dnf_multiplier)))
+        return tuple(risks)
         
     def reset(self, racecourse: str = "Tokyo") -> None:
         """Reset all Uma states to initial conditions."""
@@ -1984,13 +2183,28 @@ class RaceEngine:
             )
         self.current_time = 0.0
         self.is_finished = False
+        self._alive_bits = sum(self._uma_bits.values())
+        self._dnf_count = 0
+        self._leader_valid = False
+        self.rebuild_field()
+        
+    def rebuild_field(self) -> None:
+        """
+        Rebuild the index-ordered field lists used by tick and the pair loops.
+        
+        Names are only needed at the API boundary; the per-tick loop and the
+        neighbor scans index these lists instead of doing dict lookups.
+        """
+        self._names = list(self.uma_states)
+        self._states = [self.uma_states[name] for name in self._names]
+        
+    def retire_uma(self, uma_name: str) -> None:
+        """Clear an Uma's alive bit once it has finished or DNF'd."""
+        self._alive_bits &= ~self._uma_bits[uma_name]
         
     def get_current_phase(self, progress: float) -> RacePhase:
         """Determine current race phase from progress (0.0 to 1.0)."""
-        for phase, bounds in PHASE_CONFIGS.items():
-            if bounds['start'] <= progress < bounds['end']:
-                return phase
-        return RacePhase.FINAL_SPURT
+        return PHASE_ORDER[bisect_right(PHASE_THRESHOLDS, progress)]
     
     def get_phase_name(self, phase: RacePhase) -> str:
         """Get phase name for coefficient lookup."""
@@ -2019,7 +2233,15 @@ class RaceEngine:
             - Runaway skill enhances FR to behave like RW
             
         LOW STAT PENALTY: Low Speed stat applies multiplicative penalty
+        
+        Only depends on the Uma's (constant) stats and the phase, so the
+        result is cached per (Uma, phase) and recomputed 4 times per race.
         """
+        cache_key = (uma_name, phase)
+        cached = self._base_speed_caps.get(cache_key)
+        if cached is not None:
+            return cached
+        
         stats = self.uma_stats[uma_name]
         phase_name = self.get_phase_name(phase)
         
@@ -2063,7 +2285,9 @@ class RaceEngine:
             target_speed *= self.LOW_SPEED_PENALTY  # 0.95x
         
         # Cap at 30 m/s (from wiki: Target speed cannot exceed 30 m/s)
-        return min(target_speed, 30.0)
+        target_speed = min(target_speed, 30.0)
+        self._base_speed_caps[cache_key] = target_speed
+        return target_speed
     
     def calculate_acceleration(self, uma_name: str, phase: RacePhase, is_start_dash: bool = False) -> float:
         """
@@ -2408,7 +2632,7 @@ class RaceEngine:
         if state.is_finished or state.is_dnf:
             return
         
-        progress = state.distance / self.race_distance
+        progress = state.distance * self._inv_race_distance
         
         # Dueling ONLY in Final Spurt (last 1/6)
         if progress < 5.0 / 6.0:
@@ -2554,18 +2778,23 @@ class RaceEngine:
     # SKILLS SYSTEM
     # =========================================================================
     
-    def check_skill_conditions(self, uma_name: str, skill_id: str, progress: float) -> bool:
+    def check_skill_conditions(self, uma_name: str, skill_id: str, progress: float,
+                               skill: Optional['Skill'] = None) -> bool:
         """
         Check if all conditions are met for a skill to activate.
         
+        Args:
+            skill: Resolved skill for skill_id (looked up if not given)
+        
         Returns: True if skill can activate
         """
         if not SKILLS_AVAILABLE:
             return False
         
-        skill = get_skill_by_id(skill_id)
-        if not skill:
-            return False
+        if skill is None:
+            skill = get_skill_by_id(skill_id)
+            if not skill:
+                return False
         
         state = self.uma_states[uma_name]
         stats = self.uma_stats[uma_name]
@@ -2581,26 +2810,17 @@ class RaceEngine:
                 return False
         
         # Check phase condition
-        current_phase = self.get_current_phase(progress)
         if cond.phase != SkillTriggerPhase.ANY:
-            phase_match = False
-            if cond.phase == SkillTriggerPhase.EARLY and current_phase == RacePhase.START:
-                phase_match = True
-            elif cond.phase == SkillTriggerPhase.MID and current_phase == RacePhase.MIDDLE:
-                phase_match = True
-            elif cond.phase == SkillTriggerPhase.LATE and current_phase == RacePhase.LATE:
-                phase_match = True
-            elif cond.phase == SkillTriggerPhase.LAST_SPURT and current_phase == RacePhase.FINAL_SPURT:
-                phase_match = True
-            elif cond.phase == SkillTriggerPhase.SECOND_HALF and progress >= 0.5:
-                phase_match = True
-            if not phase_match:
+            if cond.phase == SkillTriggerPhase.SECOND_HALF:
+                if progress < 0.5:
+                    return False
+            elif SKILL_PHASE_REQUIREMENTS[cond.phase] != self.get_current_phase(progress):
                 return False
         
         # Check position condition
         if cond.position != SkillTriggerPosition.ANY:
             rank = state.position
-            total = len([s for s in self.uma_states.values() if not s.is_dnf])
+            total = len(self.uma_states) - self._dnf_count  # Shared by every position check
             position_ratio = (rank - 1) / max(total - 1, 1)  # 0 = first, 1 = last
             
             pos_match = False
@@ -2613,40 +2833,18 @@ class RaceEngine:
             if not pos_match:
                 return False
         
-        # Check terrain condition
-        if cond.terrain != SkillTriggerTerrain.ANY:
-            terrain_match = False
-            if cond.terrain == SkillTriggerTerrain.STRAIGHT and state.current_terrain == "straight":
-                terrain_match = True
-            elif cond.terrain == SkillTriggerTerrain.CORNER and state.current_terrain == "corner":
-                terrain_match = True
-            elif cond.terrain == SkillTriggerTerrain.UPHILL and state.current_terrain == "uphill":
-                terrain_match = True
-            elif cond.terrain == SkillTriggerTerrain.DOWNHILL and state.current_terrain == "downhill":
-                terrain_match = True
-            if not terrain_match:
-                return False
+        # Check terrain condition (enum values match state.current_terrain)
+        if cond.terrain != SkillTriggerTerrain.ANY and cond.terrain.value != state.current_terrain:
+            return False
         
         # Check running style requirement
         if cond.running_style != RunningStyleRequirement.ANY:
-            style_map = {
-                RunningStyleRequirement.FR: RunningStyle.FR,
-                RunningStyleRequirement.PC: RunningStyle.PC,
-                RunningStyleRequirement.LS: RunningStyle.LS,
-                RunningStyleRequirement.EC: RunningStyle.EC,
-            }
-            if stats.running_style != style_map.get(cond.running_style):
+            if stats.running_style != SKILL_STYLE_REQUIREMENTS.get(cond.running_style):
                 return False
         
         # Check race type requirement
         if cond.race_type != RaceTypeRequirement.ANY:
-            type_map = {
-                RaceTypeRequirement.SPRINT: "Sprint",
-                RaceTypeRequirement.MILE: "Mile",
-                RaceTypeRequirement.MEDIUM: "Medium",
-                RaceTypeRequirement.LONG: "Long",
-            }
-            if self.race_type != type_map.get(cond.race_type):
+            if self.race_type != SKILL_RACE_TYPE_REQUIREMENTS.get(cond.race_type):
                 return False
         
         # Check special conditions
@@ -2693,7 +2891,51 @@ class RaceEngine:
         
         return True
     
-    def try_activate_skill(self, uma_name: str, skill_id: str, progress: float) -> bool:
+    def get_applicable_skills(self, stats: UmaStats) -> List[Tuple[str, 'Skill']]:
+        """
+        Filter equipped skills down to those whose race-constant conditions
+        (running style, race type, overtaken trigger) can ever be met in this
+        race. The rest would fail check_skill_conditions on every tick.
+        
+        Returns: (skill_id, skill) pairs in equip order
+        """
+        if not SKILLS_AVAILABLE:
+            return []
+        
+        applicable = []
+        for skill_id in stats.skills:
+            skill = get_skill_by_id(skill_id)
+            if not skill:
+                continue
+            cond = skill.condition
+            if (cond.running_style != RunningStyleRequirement.ANY and
+                    stats.running_style != SKILL_STYLE_REQUIREMENTS.get(cond.running_style)):
+                continue
+            if (cond.race_type != RaceTypeRequirement.ANY and
+                    self.race_type != SKILL_RACE_TYPE_REQUIREMENTS.get(cond.race_type)):
+                continue
+            if cond.requires_overtaken:
+                continue  # Not tracked yet, never activates
+            applicable.append((skill.id, skill))  # Interned ID for per-tick set/dict keys
+        return applicable
+    
+    def group_skills_by_phase(self, skills: List[Tuple[str, 'Skill']]
+                              ) -> Dict[RacePhase, List[Tuple[str, 'Skill']]]:
+        """
+        Split (skill_id, skill) pairs into one list per race phase, keeping
+        equip order. Skills without a phase requirement (or SECOND_HALF,
+        which is progress-based) go in every list.
+        """
+        by_phase = {phase: [] for phase in PHASE_ORDER}
+        for entry in skills:
+            required = SKILL_PHASE_REQUIREMENTS.get(entry[1].condition.phase)
+            for phase, bucket in by_phase.items():
+                if required is None or required == phase:
+                    bucket.append(entry)
+        return by_phase
+    
+    def try_activate_skill(self, uma_name: str, skill_id: str, progress: float,
+                           skill: Optional['Skill'] = None) -> bool:
         """
         Try to activate a skill if conditions are met.
         Skills can only activate ONCE per race.
@@ -2708,6 +2950,9 @@ class RaceEngine:
         NEW: Inherited skills (継承スキル) get +5% activation bonus
         NEW: Evolved skills (進化スキル) have stronger effects and duration
         
+        Args:
+            skill: Resolved skill for skill_id (looked up if not given)
+        
         Returns: True if skill was activated
         """
         if not SKILLS_AVAILABLE:
@@ -2719,11 +2964,12 @@ class RaceEngine:
         if skill_id in state.skills_activated_once:
             return False
         
-        if not self.check_skill_conditions(uma_name, skill_id, progress):
-            return False
+        if skill is None:
+            skill = get_skill_by_id(skill_id)
+            if not skill:
+                return False
         
-        skill = get_skill_by_id(skill_id)
-        if not skill:
+        if not self.check_skill_conditions(uma_name, skill_id, progress, skill):
             return False
         
         stats = self.uma_stats[uma_name]
@@ -2833,6 +3079,10 @@ class RaceEngine:
             if state.skill_cooldowns[skill_id] <= 0:
                 del state.skill_cooldowns[skill_id]
         
+        # No active skills (most ticks): nothing to expire or stack
+        if not state.active_skills:
+            return 0.0, 0.0, 0.0
+        
         # Update active skills and remove expired ones
         still_active = []
         for active in state.active_skills:
@@ -2883,12 +3133,12 @@ class RaceEngine:
         # Reset timer for next check
         state.skill_check_timer = check_interval
         
-        # Check each equipped skill
-        for skill_id in stats.skills:
-            if self.try_activate_skill(uma_name, skill_id, progress):
-                skill = get_skill_by_id(skill_id)
-                if skill:
-                    activated.append(skill.name)
+        # Check each equipped skill that can match in this race
+        # (only those whose phase requirement allows the current phase)
+        phase_skills = self._applicable_skills[uma_name][self.get_current_phase(progress)]
+        for skill_id, skill in phase_skills:
+            if self.try_activate_skill(uma_name, skill_id, progress, skill):
+                activated.append(skill.name)
         
         return activated
     
@@ -2938,22 +3188,12 @@ class RaceEngine:
         
         # Check for slope effects from COURSE_SLOPES data
         if not state.is_in_corner:
-            slope_data = COURSE_SLOPES.get(self.racecourse, {})
-            surface_key = (self.race_distance, "Turf" if self.terrain == TerrainType.TURF else "Dirt")
-            slopes = slope_data.get(surface_key, [])
-            
-            current_distance = progress * self.race_distance
-            for (start_m, end_m, slope_pct) in slopes:
-                if start_m <= current_distance < end_m:
-                    if slope_pct > 0:
-                        state.current_terrain = "uphill"
-                        state.current_slope_percent = slope_pct
-                    elif slope_pct < 0:
-                        state.current_terrain = "downhill"
-                        state.current_slope_percent = slope_pct
-                    break
-            else:
-                state.current_slope_percent = 0.0
+            slope_pct = self.get_current_slope(progress * self.race_distance)
+            if slope_pct > 0:
+                state.current_terrain = "uphill"
+            elif slope_pct < 0:
+                state.current_terrain = "downhill"
+            state.current_slope_percent = slope_pct
         
         # Track corners passed (for stats/debugging)
         if state.is_in_corner and not was_in_corner:
@@ -3109,7 +3349,7 @@ class RaceEngine:
         
         # Get target distance based on running style
         effective_style = self.get_effective_running_style(stats)
-        target_distance = PACEMAKER_TARGET_DISTANCE.get(effective_style, 8.0)
+        target_distance = PACEMAKER_TARGET_DISTANCE[effective_style]
         
         # Check if in good position (within tolerance of target)
         position_diff = abs(distance_to_pacemaker - target_distance)
@@ -3176,9 +3416,10 @@ class RaceEngine:
         # Default to cruising
         state.accel_mode = AccelMode.CRUISING
     
-    def get_accel_mode_modifiers(self, uma_name: str) -> Dict[str, float]:
+    def get_accel_mode_modifiers(self, uma_name: str) -> Tuple[float, float, float]:
         """
         Get speed, accel, and HP modifiers from current accel mode.
+        Returns: (speed_mult, accel_mult, hp_mult)
         """
         state = self.uma_states[uma_name]
         return ACCEL_MODE_MODIFIERS.get(state.accel_mode, ACCEL_MODE_MODIFIERS[AccelMode.CRUISING])
@@ -3582,52 +3823,62 @@ class RaceEngine:
         
         if not state.in_final_spurt:
             state.in_final_spurt = True
+            # Guts bonus is constant for the rest of the race - compute it once
+            # Wiki: sqrt(500 × Guts) × 0.001 bonus in Last Spurt
+            effective_guts = self.get_effective_stat_with_mood(stats.guts, stats.mood)
+            state.final_spurt_guts_bonus = math.sqrt(500.0 * effective_guts) * 0.001
 
     # =========================================================================
     # NEW SYSTEMS: Slope, Blocking, Position Keep, Vision, Competition
     # =========================================================================
     
-    def get_current_slope(self, distance: float, racecourse: str = "Tokyo", 
-                          race_distance: int = None, surface: str = "Turf") -> float:
+    def get_current_slope(self, distance: float, racecourse: Optional[str] = None, 
+                          race_distance: int = None, surface: Optional[str] = None) -> float:
         """
         Get the current slope at the given race distance position.
         Uses authentic game data from COURSE_SLOPES.
         
         Args:
             distance: Current distance traveled (meters)
-            racecourse: Name of racecourse
+            racecourse: Name of racecourse (None = this race's course)
             race_distance: Total race distance (for course lookup)
-            surface: "Turf" or "Dirt"
+            surface: "Turf" or "Dirt" (None = this race's surface)
         
         Returns: slope_percent (positive = uphill, negative = downhill)
         """
-        if race_distance is None:
-            race_distance = int(self.race_distance)
+        if racecourse is None and race_distance is None and surface is None:
+            # Fast path: precomputed table for this race
+            table = self._slope_table
+            index = int(distance)
+            if 0 <= distance and index < len(table):
+                return table[index]
+            return 0.0
         
-        # Try to find specific course slopes
-        if racecourse in COURSE_SLOPES:
-            course_key = (race_distance, surface)
-            if course_key in COURSE_SLOPES[racecourse]:
-                slopes = COURSE_SLOPES[racecourse][course_key]
-                for start_m, end_m, slope in slopes:
-                    if start_m <= distance < end_m:
-                        return slope
+        # Another course was asked for: scan its segments directly rather
+        # than building a whole per-meter table for a single lookup
+        if racecourse is None:
+            racecourse = self.racecourse
+        if race_distance is None:
+            race_distance = self.race_distance
+        if surface is None:
+            surface = self._surface_str
+        slopes = COURSE_SLOPES.get(racecourse, {}).get((int(race_distance), surface), [])
+        for start_m, end_m, slope in slopes:
+            if start_m <= distance < end_m:
+                return slope
         
         # No slope data found = flat
         return 0.0
     
-    def apply_slope_effects(self, uma_name: str, distance: float, 
-                            racecourse: str = "Tokyo", race_distance: int = None,
-                            surface: str = "Turf") -> Tuple[float, float]:
+    def apply_slope_effects(self, uma_name: str, distance: float) -> Tuple[float, float]:
         """
         Apply slope effects to target speed and acceleration.
         
         Args:
             uma_name: Name of the Uma
             distance: Current distance traveled in meters
-            racecourse: Name of racecourse (e.g., "Nakayama", "Tokyo")
-            race_distance: Total race distance in meters (for course lookup)
-            surface: "Turf" or "Dirt"
+        
+        Slopes come from this race's precomputed course table.
         
         Returns: (speed_modifier, accel_modifier)
         
@@ -3635,7 +3886,7 @@ class RaceEngine:
         Downhill: triggers downhill accel mode (can exceed target speed)
         """
         state = self.uma_states[uma_name]
-        slope = self.get_current_slope(distance, racecourse, race_distance, surface)
+        slope = self.get_current_slope(distance)
         
         state.current_slope_percent = slope
         speed_modifier = 0.0
@@ -3669,85 +3920,88 @@ class RaceEngine:
         
         return speed_modifier, accel_modifier
     
-    def check_front_blocking(self, uma_name: str) -> Tuple[bool, Optional[str], float]:
+    def compute_blocking_predicates(self, uma_name: str, state: Optional[UmaState] = None
+                                    ) -> Tuple[Tuple[bool, Optional[str], float],
+                                               Tuple[bool, bool, Optional[str]]]:
         """
-        Check if Uma is front-blocked (from wiki formula).
+        Evaluate front blocking and side blocking in a single pass over the field.
         
-        Front blocking: blocks when 0 < gap < 2m, lane gap < (1 - 0.6 * gap/2) * 0.75 horse lane
-        Speed cap: (0.988 + 0.012 * gap/2) * blocker_speed
+        Both checks look at the same gap/lane differences, so they share one
+        neighbor scan instead of each walking every Uma.
         
-        Returns: (is_blocked, blocker_name, speed_cap)
+        Returns: ((is_front_blocked, front_blocker, speed_cap),
+                  (is_blocked_inward, is_blocked_outward, side_blocker))
         """
-        state = self.uma_states[uma_name]
+        if state is None:
+            state = self.uma_states[uma_name]
         
         if state.is_finished or state.is_dnf:
-            return False, None, float('inf')
-        
-        for other_name, other_state in self.uma_states.items():
-            if other_name == uma_name:
-                continue
-            if other_state.is_finished or other_state.is_dnf:
-                continue
-            
-            # Check distance gap (other must be ahead)
-            gap = other_state.distance - state.distance
-            if not (0 < gap < FRONT_BLOCK_MAX_GAP):
-                continue
-            
-            # Check lane gap (using proper lane position)
-            lane_gap = abs(other_state.lane_position - state.lane_position)
-            lane_threshold = (1.0 - 0.6 * gap / 2.0) * FRONT_BLOCK_LANE_THRESHOLD * HORSE_LANE
-            
-            if lane_gap < lane_threshold:
-                # Blocked!
-                speed_cap = (BLOCKED_SPEED_BASE + BLOCKED_SPEED_GAP_FACTOR * gap / 2.0) * other_state.current_speed
-                return True, other_name, speed_cap
-        
-        return False, None, float('inf')
-    
-    def check_side_blocking(self, uma_name: str) -> Tuple[bool, bool, Optional[str]]:
-        """
-        Check if Uma is side-blocked (inward or outward).
-        
-        Side blocking: blocks when |gap| < 1.05m, lane gap < 2 horse lane
-        
-        Returns: (is_blocked_inward, is_blocked_outward, blocker_name)
-        """
-        state = self.uma_states[uma_name]
+            return (False, None, float('inf')), (False, False, None)
         
-        if state.is_finished or state.is_dnf:
-            return False, False, None
+        my_distance = state.distance
+        my_lane = state.lane_position
         
+        front = None
         blocked_in = False
         blocked_out = False
-        blocker = None
+        side_blocker = None
         
-        for other_name, other_state in self.uma_states.items():
-            if other_name == uma_name:
-                continue
-            if other_state.is_finished or other_state.is_dnf:
+        # Running Uma other than ourselves, one bit per field index
+        others = self._alive_bits & ~self._uma_bits[uma_name]
+        for idx, other_state in enumerate(self._states):
+            if not (others >> idx) & 1:
                 continue
             
-            # Check distance gap (side blocking can be ahead or behind)
-            gap = abs(other_state.distance - state.distance)
-            if gap >= SIDE_BLOCK_GAP_THRESHOLD:
-                continue
+            gap = other_state.distance - my_distance
+            lane_diff = other_state.lane_position - my_lane
             
-            # Check lane gap
-            lane_gap = abs(other_state.lane_position - state.lane_position)
-            lane_threshold = SIDE_BLOCK_LANE_THRESHOLD * HORSE_LANE
+            # Front blocking: 0 < gap < 2m, lane gap < (1 - 0.6 * gap/2) * 0.75 horse lane
+            # (first blocker found wins)
+            if front is None and 0 < gap < FRONT_BLOCK_MAX_GAP:
+                lane_threshold = (1.0 - 0.6 * gap / 2.0) * FRONT_BLOCK_LANE_THRESHOLD * HORSE_LANE
+                if abs(lane_diff) < lane_threshold:
+                    # Blocked!
+                    speed_cap = (BLOCKED_SPEED_BASE + BLOCKED_SPEED_GAP_FACTOR * gap / 2.0) * other_state.current_speed
+                    front = (True, self._names[idx], speed_cap)
             
-            if lane_gap < lane_threshold:
-                blocker = other_name
+            # Side blocking: |gap| < 1.05m, lane gap < 2 horse lane (ahead or behind)
+            if gap * gap < SIDE_BLOCK_GAP_SQ and lane_diff * lane_diff < SIDE_BLOCK_LANE_SQ:
+                side_blocker = self._names[idx]
                 # Determine if blocking inward or outward
-                if other_state.lane_position < state.lane_position:
+                if other_state.lane_position < my_lane:
                     blocked_in = True
                 else:
                     blocked_out = True
         
-        return blocked_in, blocked_out, blocker
+        if front is None:
+            front = (False, None, float('inf'))
+        return front, (blocked_in, blocked_out, side_blocker)
+    
+    def check_front_blocking(self, uma_name: str,
+                             state: Optional[UmaState] = None) -> Tuple[bool, Optional[str], float]:
+        """
+        Check if Uma is front-blocked (from wiki formula).
+        
+        Front blocking: blocks when 0 < gap < 2m, lane gap < (1 - 0.6 * gap/2) * 0.75 horse lane
+        Speed cap: (0.988 + 0.012 * gap/2) * blocker_speed
+        
+        Returns: (is_blocked, blocker_name, speed_cap)
+        """
+        return self.compute_blocking_predicates(uma_name, state)[0]
     
-    def check_overlap_bump(self, uma_name: str) -> Tuple[bool, Optional[str]]:
+    def check_side_blocking(self, uma_name: str,
+                            state: Optional[UmaState] = None) -> Tuple[bool, bool, Optional[str]]:
+        """
+        Check if Uma is side-blocked (inward or outward).
+        
+        Side blocking: blocks when |gap| < 1.05m, lane gap < 2 horse lane
+        
+        Returns: (is_blocked_inward, is_blocked_outward, blocker_name)
+        """
+        return self.compute_blocking_predicates(uma_name, state)[1]
+    
+    def check_overlap_bump(self, uma_name: str,
+                           state: Optional[UmaState] = None) -> Tuple[bool, Optional[str]]:
         """
         Check for overlapping bump (Uma too close, outer one gets bumped).
         
@@ -3755,31 +4009,30 @@ class RaceEngine:
         
         Returns: (should_bump_outer, other_uma_name)
         """
-        state = self.uma_states[uma_name]
+        if state is None:
+            state = self.uma_states[uma_name]
         
         if state.is_finished or state.is_dnf:
             return False, None
         
-        for other_name, other_state in self.uma_states.items():
-            if other_name == uma_name:
-                continue
-            if other_state.is_finished or other_state.is_dnf:
+        others = self._alive_bits & ~self._uma_bits[uma_name]
+        for idx, other_state in enumerate(self._states):
+            if not (others >> idx) & 1:
                 continue
             
             # Check distance gap
-            gap = abs(other_state.distance - state.distance)
-            if gap >= OVERLAP_BUMP_GAP_THRESHOLD:
+            gap = other_state.distance - state.distance
+            if gap * gap >= OVERLAP_BUMP_GAP_SQ:
                 continue
             
             # Check lane gap
-            lane_gap = abs(other_state.lane_position - state.lane_position)
-            lane_threshold = OVERLAP_BUMP_LANE_THRESHOLD * HORSE_LANE
+            lane_gap = other_state.lane_position - state.lane_position
             
-            if lane_gap < lane_threshold:
+            if lane_gap * lane_gap < OVERLAP_BUMP_LANE_SQ:
                 # Bump the outer Uma
                 if state.lane_position > other_state.lane_position:
                     # We're the outer one, we get bumped
-                    return True, other_name
+                    return True, self._names[idx]
         
         return False, None
     
@@ -3797,15 +4050,7 @@ class RaceEngine:
             return None, 0.0, 0.0
         
         # Find the current leader (pacemaker)
-        pacemaker_name = None
-        pacemaker_distance = 0.0
-        
-        for other_name, other_state in self.uma_states.items():
-            if other_state.is_finished or other_state.is_dnf:
-                continue
-            if other_state.distance > pacemaker_distance:
-                pacemaker_distance = other_state.distance
-                pacemaker_name = other_name
+        pacemaker_name, pacemaker_distance = self.get_leader()
         
         if pacemaker_name is None or pacemaker_name == uma_name:
             # We are the pacemaker or no others exist
@@ -3814,6 +4059,51 @@ class RaceEngine:
         distance_to_pacemaker = pacemaker_distance - state.distance
         return pacemaker_name, pacemaker_distance, distance_to_pacemaker
     
+    def get_leader(self) -> Tuple[Optional[str], float]:
+        """
+        Get the current leader among running Uma as (name, distance).
+        
+        The leader is cached and kept up to date by update_leader as Uma move,
+        so the full scan only runs when the cache is invalidated (leader
+        finished/DNF, ties, add_uma/reset). Returns (None, 0.0) while nobody
+        has moved yet.
+        """
+        if self._leader_valid:
+            leader_name = self._leader_name
+            if leader_name is None:
+                return None, 0.0
+            leader_state = self.uma_states[leader_name]
+            if not leader_state.is_finished and not leader_state.is_dnf:
+                return leader_name, leader_state.distance
+        
+        leader_name = None
+        leader_distance = 0.0
+        alive_bits = self._alive_bits
+        for idx, other_state in enumerate(self._states):
+            if not (alive_bits >> idx) & 1:
+                continue
+            if other_state.distance > leader_distance:
+                leader_distance = other_state.distance
+                leader_name = self._names[idx]
+        
+        self._leader_name = leader_name
+        self._leader_valid = True
+        return leader_name, leader_distance
+    
+    def update_leader(self, uma_name: str, state: UmaState) -> None:
+        """Update the cached leader after an Uma's distance increased."""
+        if not self._leader_valid:
+            return
+        leader_name = self._leader_name
+        if leader_name == uma_name:
+            return
+        leader_distance = self.uma_states[leader_name].distance if leader_name is not None else 0.0
+        if state.distance > leader_distance:
+            self._leader_name = uma_name
+        elif state.distance == leader_distance:
+            # Tie - let the next get_leader rescan (first in field order wins)
+            self._leader_valid = False
+    
     def update_lane_position(self, uma_name: str, delta_time: float, 
                              racecourse: str = "Tokyo") -> None:
         """
@@ -3845,7 +4135,7 @@ class RaceEngine:
             )
         
         # Check for overlap bump
-        should_bump, _ = self.check_overlap_bump(uma_name)
+        should_bump, _ = self.check_overlap_bump(uma_name, state)
         if should_bump:
             # Get bumped outward
             max_lane = RACECOURSE_MAX_LANES.get(racecourse, 1.2)
@@ -3866,14 +4156,17 @@ class RaceEngine:
         
         Position keep is only active in opening and middle phases (first 2/3 of race).
         """
-        state = self.uma_states[uma_name]
-        stats = self.uma_stats[uma_name]
-        
         # Position keep only active in first 2/3 of race (opening + middle)
+        # Checked before any state lookup - this path covers 1/3 of the race
         if progress > 0.67:
-            state.position_keep_mode = PositionKeepMode.NORMAL
+            state = self.uma_states[uma_name]
+            if state.position_keep_mode != PositionKeepMode.NORMAL:
+                state.position_keep_mode = PositionKeepMode.NORMAL
             return PositionKeepMode.NORMAL
         
+        state = self.uma_states[uma_name]
+        stats = self.uma_stats[uma_name]
+        
         # Get pacemaker info
         pacemaker_name, pacemaker_distance, distance_to_pacemaker = self.get_pacemaker_info(uma_name)
         
@@ -3899,60 +4192,37 @@ class RaceEngine:
             # FRONT RUNNER / RUNAWAY: Try to BE the pacemaker
             # =================================================================
             if pacemaker_name == uma_name:
-                # We ARE the pacemaker
-                # Check if 2nd place is too close
-                if my_rank == 0 and total_uma > 1:
-                    second_distance = positions[1][1]
-                    lead_gap = state.distance - second_distance
-                    
-                    if lead_gap < FR_SPEED_UP_GAP:
-                        # 2nd place too close, speed up
-                        if random.random() < 0.5 * wisdom_factor:
-                            state.position_keep_mode = PositionKeepMode.SPEED_UP
-                        else:
-                            state.position_keep_mode = PositionKeepMode.NORMAL
-                    else:
-                        state.position_keep_mode = PositionKeepMode.NORMAL
+                # We ARE the pacemaker - check if 2nd place is too close
+                if (my_rank == 0 and total_uma > 1
+                        and state.distance - positions[1][1] < FR_SPEED_UP_GAP):
+                    situation = 'lead_threatened'
                 else:
-                    state.position_keep_mode = PositionKeepMode.NORMAL
+                    situation = 'lead_safe'
+            elif distance_to_pacemaker > FR_TARGET_LEAD:
+                # Very far behind - OVERTAKE mode
+                situation = 'chasing_far'
             else:
-                # We're NOT the pacemaker - need to catch up
-                if distance_to_pacemaker > FR_TARGET_LEAD:
-                    # Very far behind - OVERTAKE mode
-                    if random.random() < 0.4 * wisdom_factor:
-                        state.position_keep_mode = PositionKeepMode.OVERTAKE
-                    else:
-                        state.position_keep_mode = PositionKeepMode.SPEED_UP
-                else:
-                    # Close but not leading - SPEED_UP
-                    if random.random() < 0.3 * wisdom_factor:
-                        state.position_keep_mode = PositionKeepMode.SPEED_UP
-                    else:
-                        state.position_keep_mode = PositionKeepMode.NORMAL
+                # Close but not leading - SPEED_UP
+                situation = 'chasing_close'
         else:
             # =================================================================
             # NON-FR (PC/LS/EC): Follow the pacemaker
             # =================================================================
-            target_distance = PACEMAKER_TARGET_DISTANCE.get(stats.running_style, 8.0)
+            target_distance = PACEMAKER_TARGET_DISTANCE[stats.running_style]
             
             # Add some variance based on wisdom (smarter = more precise)
             variance = (1.0 - (wisdom_factor / 1.5)) * 2.0  # 0-2m variance
             
             if distance_to_pacemaker < target_distance - PACEMAKER_TOO_CLOSE:
-                # Too CLOSE to pacemaker - slow down
-                if random.random() < 0.4 * wisdom_factor:
-                    state.position_keep_mode = PositionKeepMode.PACE_DOWN
-                else:
-                    state.position_keep_mode = PositionKeepMode.NORMAL
+                situation = 'too_close'
             elif distance_to_pacemaker > target_distance + PACEMAKER_TOO_FAR + variance:
-                # Too FAR from pacemaker - speed up
-                if random.random() < 0.3 * wisdom_factor:
-                    state.position_keep_mode = PositionKeepMode.PACE_UP
-                else:
-                    state.position_keep_mode = PositionKeepMode.NORMAL
+                situation = 'too_far'
             else:
-                # In good position
-                state.position_keep_mode = PositionKeepMode.NORMAL
+                situation = 'in_position'
+        
+        mode_on_roll, roll_chance, mode = POSITION_KEEP_TRANSITIONS[situation]
+        if roll_chance > 0.0 and random.random() < roll_chance * wisdom_factor:
+            mode = mode_on_roll
         
         # =================================================================
         # Check for wrong strategy order (Pace Up EX) - rare event
@@ -3968,17 +4238,20 @@ class RaceEngine:
                     RunningStyle.RW: 0, RunningStyle.FR: 1, 
                     RunningStyle.PC: 2, RunningStyle.LS: 3, RunningStyle.EC: 4
                 }
-                my_effective_style = self.get_effective_running_style(stats)
                 ahead_effective_style = self.get_effective_running_style(ahead_name)
-                my_order = style_order.get(my_effective_style, 2)
+                my_order = style_order.get(effective_style, 2)
                 ahead_order = style_order.get(ahead_effective_style, 2)
                 
                 # If we're a faster strategy (lower order) but behind a slower one
                 if my_order < ahead_order - 1:  # We're 2+ faster but behind
                     if random.random() < 0.05:  # 5% chance to trigger
-                        state.position_keep_mode = PositionKeepMode.PACE_UP_EX
+                        mode = PositionKeepMode.PACE_UP_EX
+        
+        # Only write back when the mode actually changed
+        if state.position_keep_mode != mode:
+            state.position_keep_mode = mode
         
-        return state.position_keep_mode
+        return mode
     
     def update_vision_system(self, uma_name: str) -> None:
         """
@@ -4023,8 +4296,9 @@ class RaceEngine:
         elif state.position >= 6:
             vision_range *= 1.1  # Back: more strategic awareness
         
-        for other_name, other_state in self.uma_states.items():
-            if other_name == uma_name or other_state.is_finished or other_state.is_dnf:
+        others = self._alive_bits & ~self._uma_bits[uma_name]
+        for idx, other_state in enumerate(self._states):
+            if not (others >> idx) & 1:
                 continue
             
             distance_diff = other_state.distance - state.distance
@@ -4039,7 +4313,7 @@ class RaceEngine:
                 max_lane_gap = vision_cone_width + 0.5
             
             if lane_gap <= max_lane_gap:
-                state.visible_umas.append(other_name)
+                state.visible_umas.append(self._names[idx])
         
         state.visible_distance = vision_range
         state.vision_cone_width = vision_cone_width
@@ -4101,9 +4375,7 @@ class RaceEngine:
         
         # Compete Before Spurt: LS/EC before spurt starts
         if stats.running_style in [RunningStyle.LS, RunningStyle.EC]:
-            spurt_start = 5/6
-            before_spurt_start = spurt_start - (BEFORE_SPURT_DISTANCE / self.race_distance)
-            if before_spurt_start <= progress < spurt_start:
+            if self._before_spurt_start <= progress < 5/6:
                 if len(state.visible_umas) > 0:  # Can see someone to compete with
                     state.is_competing_before_spurt = True
                     speed_bonus += (BEFORE_SPURT_SPEED_BONUS - 1.0) * self.base_speed
@@ -4161,7 +4433,8 @@ class RaceEngine:
             return state.section_speed_randoms[section]
         return 1.0
 
-    def check_lane_blocking(self, uma_name: str) -> Tuple[bool, float]:
+    def check_lane_blocking(self, uma_name: str,
+                            state: Optional[UmaState] = None) -> Tuple[bool, float]:
         """
         Check if Uma is blocked using the new wiki-accurate blocking system.
         
@@ -4173,14 +4446,18 @@ class RaceEngine:
         
         Falls back to simplified blocking if new system doesn't find blocks.
         """
-        state = self.uma_states[uma_name]
+        if state is None:
+            state = self.uma_states[uma_name]
         stats = self.uma_stats[uma_name]
         
         if state.is_finished or state.is_dnf:
             return False, 1.0
         
+        # Front and side blocking share one scan of the field
+        front_result, side_result = self.compute_blocking_predicates(uma_name, state)
+        
         # First, check using new wiki-accurate front blocking
-        is_front_blocked, blocker_name, speed_cap = self.check_front_blocking(uma_name)
+        is_front_blocked, blocker_name, speed_cap = front_result
         
         if is_front_blocked and blocker_name:
             state.is_blocked = True
@@ -4209,7 +4486,7 @@ class RaceEngine:
             return True, max(0.85, speed_mult)  # Minimum 85% speed
         
         # Check side blocking
-        blocked_in, blocked_out, side_blocker = self.check_side_blocking(uma_name)
+        blocked_in, blocked_out, side_blocker = side_result
         state.is_side_blocked_in = blocked_in
         state.is_side_blocked_out = blocked_out
         
@@ -4237,7 +4514,6 @@ class RaceEngine:
         Stats in range 100-1500 should virtually never cause DNF.
         """
         state = self.uma_states[uma_name]
-        stats = self.uma_stats[uma_name]
         
         if state.is_finished or state.is_dnf:
             return False
@@ -4246,35 +4522,30 @@ class RaceEngine:
         if state.current_speed < 1.0 and state.distance < self.race_distance * 0.99:
             state.is_dnf = True
             state.dnf_reason = "stopped"
+            self._dnf_count += 1
+            self.retire_uma(uma_name)
             return True
         
         # LOW STAT PENALTY: Only CRITICALLY low stats (<100) = tiny risk of random DNF
-        # Stats 100+ should be safe!
-        critical_stats = [
-            (stats.stamina, "exhaustion"),
-            (stats.guts, "gave_up"),
-            (stats.power, "injury"),
-        ]
+        # Stats 100+ should be safe! (no risks precomputed -> nothing to do)
+        risks = self._dnf_risks.get(uma_name)
+        if not risks:
+            return False
         
-        for stat_value, reason in critical_stats:
-            effective_stat = self.get_effective_stat(stat_value)
-            # Only trigger if BELOW 100 (critical threshold)
-            if effective_stat < self.CRITICAL_STAT_THRESHOLD:
-                # Below 100: tiny chance per tick to DNF
-                # Lower stat = higher chance, but still very rare
-                stat_deficit = self.CRITICAL_STAT_THRESHOLD - effective_stat
-                dnf_multiplier = stat_deficit / 100.0  # 0.0 at 100, 1.0 at 0
-                dnf_chance = self.DNF_CHANCE_PER_TICK * (1.0 + dnf_multiplier)
-                
-                # Only apply after 30% into race AND only check occasionally (every ~2 seconds)
-                race_progress = state.distance / self.race_distance
-                if race_progress > 0.3 and race_progress < 0.9:
-                    # Random check gate - only 10% of ticks actually check
-                    if random.random() < 0.1:
-                        if random.random() < dnf_chance:
-                            state.is_dnf = True
-                            state.dnf_reason = reason
-                            return True
+        # Only apply after 30% into race AND before 90%
+        race_progress = state.distance * self._inv_race_distance
+        if race_progress <= 0.3 or race_progress >= 0.9:
+            return False
+        
+        for reason, dnf_chance in risks:
+            # Random check gate - only 10% of ticks actually check (every ~2 seconds)
+            if random.random() < 0.1:
+                if random.random() < dnf_chance:
+                    state.is_dnf = True
+                    state.dnf_reason = reason
+                    self._dnf_count += 1
+                    self.retire_uma(uma_name)
+                    return True
         
         return False
     
@@ -4315,135 +4586,167 @@ class RaceEngine:
         
         self.current_time += delta_time
         
-        # Calculate positions for lane blocking
-        positions = sorted(
-            [(name, state.distance) for name, state in self.uma_states.items()
-             if not state.is_finished and not state.is_dnf],
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        # Update position rankings
-        for rank, (name, _) in enumerate(positions):
-            self.uma_states[name].position = rank + 1
-        
-        # Process each Uma
-        for uma_name in self.uma_states:
-            state = self.uma_states[uma_name]
-            stats = self.uma_stats[uma_name]
-            
-            if state.is_finished or state.is_dnf:
-                continue
+        # Per-tick speed variance draws come from the shared seeded stream;
+        # bind the generator once instead of resolving random.random per Uma
+        variance_random = random.random
+        
+        # Indices of Uma still running (finished/DNF Uma are skipped entirely).
+        # An Uma can only retire while it is being processed, so this
+        # snapshot stays valid for the whole loop below.
+        names, states = self._names, self._states
+        alive_bits = self._alive_bits
+        active_idx = [idx for idx in range(len(states)) if (alive_bits >> idx) & 1]
+        
+        # Update position rankings (running Uma only, leader first)
+        running = [states[idx] for idx in active_idx]
+        running.sort(key=_BY_DISTANCE, reverse=True)
+        for rank, state in enumerate(running, 1):
+            state.position = rank
+        
+        # Pre-bind per-Uma methods and race constants used in the loop below
+        # (saves an attribute lookup per call per Uma per tick)
+        check_rushing = self.check_rushing
+        check_temptation = self.check_temptation
+        check_spot_struggle = self.check_spot_struggle
+        check_dueling = self.check_dueling
+        check_repositioning = self.check_repositioning
+        update_lane_position = self.update_lane_position
+        update_vision_system = self.update_vision_system
+        update_position_keep_mode = self.update_position_keep_mode
+        check_competition_systems = self.check_competition_systems
+        check_power_release = self.check_power_release
+        get_section_speed_random = self.get_section_speed_random
+        check_coasting_activation = self.check_coasting_activation
+        update_accel_mode = self.update_accel_mode
+        update_fatigue = self.update_fatigue
+        update_debuffs = self.update_debuffs
+        get_coasting_effects = self.get_coasting_effects
+        get_accel_mode_modifiers = self.get_accel_mode_modifiers
+        get_fatigue_penalties = self.get_fatigue_penalties
+        simulate_terrain = self.simulate_terrain
+        check_and_activate_skills = self.check_and_activate_skills
+        update_active_skills = self.update_active_skills
+        check_final_spurt_activation = self.check_final_spurt_activation
+        apply_final_spurt = self.apply_final_spurt
+        apply_slope_effects = self.apply_slope_effects
+        calculate_base_speed_cap = self.calculate_base_speed_cap
+        get_duel_bonus = self.get_duel_bonus
+        get_temptation_effects = self.get_temptation_effects
+        calculate_acceleration = self.calculate_acceleration
+        calculate_minimum_speed = self.calculate_minimum_speed
+        get_effective_running_style = self.get_effective_running_style
+        check_lane_blocking = self.check_lane_blocking
+        update_leader = self.update_leader
+        calculate_stamina_drain = self.calculate_stamina_drain
+        retire_uma = self.retire_uma
+        check_dnf = self.check_dnf
+        dnf_risks = self._dnf_risks
+        current_time = self.current_time
+        race_distance = self.race_distance
+        inv_race_distance = self._inv_race_distance
+        start_dash_threshold = self._start_dash_threshold
+        
+        # Process each running Uma (in uma_states order)
+        for idx in active_idx:
+            uma_name = names[idx]
+            state = states[idx]
             
             # GameTora: Start delay - Uma doesn't move until delay passes
-            if self.current_time < state.start_delay:
+            if current_time < state.start_delay:
                 continue
             
             # Calculate progress
-            progress = state.distance / self.race_distance
+            progress = state.distance * inv_race_distance
             
-            # Get current phase
-            phase = self.get_current_phase(progress)
+            # Get current phase (inlined get_current_phase)
+            phase = PHASE_ORDER[bisect_right(PHASE_THRESHOLDS, progress)]
             
             # GameTora mechanics checks
-            self.check_rushing(uma_name, progress, delta_time)
-            self.check_temptation(uma_name, progress, delta_time)  # Temptation (かかり)
-            self.check_spot_struggle(uma_name)
-            self.check_dueling(uma_name, delta_time)
+            check_rushing(uma_name, progress, delta_time)
+            check_temptation(uma_name, progress, delta_time)  # Temptation (かかり)
+            check_spot_struggle(uma_name)
+            check_dueling(uma_name, delta_time)
             
             # NEW: Repositioning (位置取り調整) - mid-race positioning boost
-            repositioning_bonus = self.check_repositioning(uma_name, progress, delta_time)
+            repositioning_bonus = check_repositioning(uma_name, progress, delta_time)
             
             # NEW SYSTEMS: Update lane, vision, position keep, competition
-            self.update_lane_position(uma_name, delta_time)
-            self.update_vision_system(uma_name)
-            position_keep_mode = self.update_position_keep_mode(uma_name, progress)
-            comp_speed_bonus, comp_hp_save = self.check_competition_systems(uma_name, progress, delta_time)
-            power_release_bonus = self.check_power_release(uma_name, progress)
-            section_speed_mult = self.get_section_speed_random(uma_name, progress)
+            update_lane_position(uma_name, delta_time)
+            update_vision_system(uma_name)
+            position_keep_mode = update_position_keep_mode(uma_name, progress)
+            comp_speed_bonus, comp_hp_save = check_competition_systems(uma_name, progress, delta_time)
+            power_release_bonus = check_power_release(uma_name, progress)
+            section_speed_mult = get_section_speed_random(uma_name, progress)
             
             # NEW: Update coasting, accel mode, fatigue, debuffs
-            self.check_coasting_activation(uma_name)
-            self.update_accel_mode(uma_name, progress)
-            self.update_fatigue(uma_name, delta_time)
-            self.update_debuffs(uma_name, delta_time)
+            check_coasting_activation(uma_name)
+            update_accel_mode(uma_name, progress)
+            update_fatigue(uma_name, delta_time)
+            update_debuffs(uma_name, delta_time)
             
             # Get modifiers from new systems
-            coasting_speed_mod, coasting_hp_mod = self.get_coasting_effects(uma_name)
-            accel_mode_mods = self.get_accel_mode_modifiers(uma_name)
-            fatigue_speed_mod, fatigue_accel_mod = self.get_fatigue_penalties(uma_name)
+            coasting_speed_mod, coasting_hp_mod = get_coasting_effects(uma_name)
+            am_speed, am_accel, am_hp = get_accel_mode_modifiers(uma_name)
+            fatigue_speed_mod, fatigue_accel_mod = get_fatigue_penalties(uma_name)
             
             # Skills system: Update terrain and check skill activations
-            self.simulate_terrain(uma_name, progress)
+            simulate_terrain(uma_name, progress)
             
             # Decrement skill check timer
             state.skill_check_timer = max(0, state.skill_check_timer - delta_time)
             
-            self.check_and_activate_skills(uma_name, progress)
-            skill_speed_bonus, skill_accel_bonus, skill_stamina_save = self.update_active_skills(uma_name, delta_time)
+            check_and_activate_skills(uma_name, progress)
+            skill_speed_bonus, skill_accel_bonus, skill_stamina_save = update_active_skills(uma_name, delta_time)
             
             # Check final spurt activation
-            if self.check_final_spurt_activation(uma_name, progress):
-                self.apply_final_spurt(uma_name)
-            
-            # Calculate speed cap (target speed)
-            speed_cap = self.calculate_base_speed_cap(uma_name, phase)
-            
-            # Apply position keep mode modifier
-            position_keep_modifier = POSITION_KEEP_SPEED_MODIFIERS.get(position_keep_mode, 1.0)
-            speed_cap *= position_keep_modifier
+            if check_final_spurt_activation(uma_name, progress):
+                apply_final_spurt(uma_name)
             
             # Apply slope effects (using actual distance, not progress)
-            surface = "Turf" if self.terrain == TerrainType.TURF else "Dirt"
-            slope_speed_mod, slope_accel_mod = self.apply_slope_effects(
-                uma_name, state.distance, self.racecourse, self.race_distance, surface
-            )
-            speed_cap += slope_speed_mod
-            
-            # Apply section speed random
-            speed_cap *= section_speed_mult
+            slope_speed_mod, slope_accel_mod = apply_slope_effects(uma_name, state.distance)
             
-            # NEW: Apply corner speed modifier
-            speed_cap *= state.corner_speed_modifier
-            
-            # NEW: Apply coasting and fatigue modifiers
-            speed_cap *= coasting_speed_mod
-            speed_cap *= accel_mode_mods['speed']
-            speed_cap *= fatigue_speed_mod
+            # Calculate speed cap (target speed) in one fused expression:
+            # (base × position keep + slope) × section random × corner × coasting
+            # × accel mode × fatigue. Evaluated left to right, same as applying
+            # each modifier in turn.
+            speed_cap = (
+                (calculate_base_speed_cap(uma_name, phase)
+                 * POSITION_KEEP_SPEED_MODIFIERS[position_keep_mode]
+                 + slope_speed_mod)
+                * section_speed_mult
+                * state.corner_speed_modifier
+                * coasting_speed_mod
+                * am_speed
+                * fatigue_speed_mod
+            )
             
             # Final spurt bonus: Guts affects last spurt target speed
-            # Wiki: sqrt(500 × Guts) × 0.001 bonus in Last Spurt
+            # (cached by apply_final_spurt)
             if state.in_final_spurt:
-                effective_guts = self.get_effective_stat_with_mood(stats.guts, stats.mood)
-                guts_speed_bonus = math.sqrt(500.0 * effective_guts) * 0.001
-                speed_cap += guts_speed_bonus
+                speed_cap += state.final_spurt_guts_bonus
             
             # GameTora: Dueling bonus to speed cap
-            duel_speed_bonus, duel_accel_bonus = self.get_duel_bonus(uma_name)
+            duel_speed_bonus, duel_accel_bonus = get_duel_bonus(uma_name)
             speed_cap += duel_speed_bonus
             
             # Temptation (かかり): Involuntary speed boost when losing control
-            temptation_speed_boost, _ = self.get_temptation_effects(uma_name)
+            temptation_speed_boost, _ = get_temptation_effects(uma_name)
             speed_cap += temptation_speed_boost
             
             # Skills: Add speed bonus from active skills
-            # Add competition and power release bonuses
-            speed_cap += comp_speed_bonus
-            speed_cap += power_release_bonus
-            speed_cap += skill_speed_bonus
-            
-            # NEW: Apply repositioning bonus multiplier (位置取り調整)
-            speed_cap *= repositioning_bonus
+            # Add competition and power release bonuses, then apply the
+            # repositioning bonus multiplier (位置取り調整)
+            speed_cap = (speed_cap + comp_speed_bonus + power_release_bonus
+                         + skill_speed_bonus) * repositioning_bonus
             
             # Start dash detection: applies until speed reaches 0.85 × BaseSpeed
             # GameTora: Late starts (0.066s+) LOSE this bonus
-            start_dash_threshold = 0.85 * self.base_speed
             is_start_dash = (state.current_speed < start_dash_threshold and 
                            phase == RacePhase.START and 
                            not state.is_late_start)
             
             # Calculate acceleration with start dash flag
-            acceleration = self.calculate_acceleration(uma_name, phase, is_start_dash)
+            acceleration = calculate_acceleration(uma_name, phase, is_start_dash)
             
             # Apply slope acceleration modifier
             acceleration *= slope_accel_mod
@@ -4455,59 +4758,28 @@ class RaceEngine:
             acceleration += skill_accel_bonus
             
             # NEW: Apply accel mode and fatigue modifiers to acceleration
-            acceleration *= accel_mode_mods['accel']
+            acceleration *= am_accel
             acceleration *= fatigue_accel_mod
             
             # Calculate minimum speed (from wiki formula)
-            minimum_speed = self.calculate_minimum_speed(uma_name)
+            minimum_speed = calculate_minimum_speed(uma_name)
             
-            # Update speed based on HP state
+            # Out of HP: decelerate to minimum speed
+            decel_rate = 0.0
             if state.hp <= 0:
-                # Out of HP: decelerate to minimum speed
                 # Wiki: deceleration rates vary by phase (strategy-specific)
-                if phase == RacePhase.START:
-                    decel_rate = 1.2  # Opening phase: -1.2 m/s²
-                elif phase == RacePhase.MIDDLE:
-                    decel_rate = 0.8  # Middle phase: -0.8 m/s²
-                else:
-                    decel_rate = 1.0  # Final phase: -1.0 m/s²
-                
                 # Strategy affects decel rate (use effective style for FR with Runaway)
-                effective_style = self.get_effective_running_style(stats)
-                if effective_style in [RunningStyle.EC, RunningStyle.LS]:
-                    decel_rate *= 0.9  # Slower decel for late runners
-                elif effective_style in [RunningStyle.FR, RunningStyle.RW]:
-                    decel_rate *= 1.1  # Faster decel for front runners
-                
-                if state.current_speed > minimum_speed:
-                    state.current_speed = max(
-                        minimum_speed,
-                        state.current_speed - decel_rate * delta_time
-                    )
-            else:
-                # Normal movement: accelerate toward target speed
-                # Downhill accel mode can exceed target speed
-                effective_cap = speed_cap
-                if state.is_in_downhill_accel:
-                    effective_cap += DOWNHILL_ACCEL_EXTRA_SPEED
-                
-                if state.current_speed < effective_cap:
-                    state.current_speed = min(
-                        effective_cap,
-                        state.current_speed + acceleration * delta_time
-                    )
-                elif state.current_speed > speed_cap:
-                    # Decelerate if above cap (slower than acceleration)
-                    state.current_speed = max(
-                        speed_cap,
-                        state.current_speed - 0.5 * delta_time
-                    )
+                decel_rate = (OUT_OF_HP_DECEL_RATES[phase]
+                              * OUT_OF_HP_DECEL_STYLE_MULT[get_effective_running_style(uma_name)])
             
-            # Enforce minimum speed floor
-            state.current_speed = max(state.current_speed, minimum_speed)
+            # Update speed based on HP state (pure numeric kernel)
+            state.current_speed = advance_speed(
+                state.current_speed, speed_cap, acceleration, minimum_speed,
+                decel_rate, state.is_in_downhill_accel, delta_time
+            )
             
             # Check lane blocking
-            is_blocked, block_multiplier = self.check_lane_blocking(uma_name)
+            is_blocked, block_multiplier = check_lane_blocking(uma_name, state)
             
             # Calculate effective speed (with blocking penalty)
             effective_speed = state.current_speed * block_multiplier
@@ -4515,7 +4787,7 @@ class RaceEngine:
             # Apply small random variance (±1.5%) for natural variation
             # Combines per-Uma seed with per-tick randomness
             base_variance = 1.0 + state.speed_variance_seed  # Per-Uma consistent factor
-            tick_variance = 0.99 + random.random() * 0.02    # Per-tick randomness ±1%
+            tick_variance = 0.99 + variance_random() * 0.02  # Per-tick randomness ±1%
             effective_speed *= base_variance * tick_variance
             
             # Store previous distance for precise finish calculation
@@ -4523,10 +4795,11 @@ class RaceEngine:
             
             # Update distance
             state.distance += effective_speed * delta_time
+            update_leader(uma_name, state)
             
             # Calculate HP drain (only if HP > 0)
             if state.hp > 0:
-                hp_drain = self.calculate_stamina_drain(uma_name, phase, effective_speed)
+                hp_drain = calculate_stamina_drain(uma_name, phase, effective_speed)
                 
                 # Final spurt increases drain (wiki: additional consumption during spurt)
                 if state.in_final_spurt:
@@ -4540,7 +4813,7 @@ class RaceEngine:
                 hp_drain *= coasting_hp_mod
                 
                 # Acceleration mode HP modifier
-                hp_drain *= accel_mode_mods['hp']
+                hp_drain *= am_hp
                 
                 # Skills: Apply stamina save reduction from active skills
                 if skill_stamina_save > 0:
@@ -4559,35 +4832,39 @@ class RaceEngine:
             # Update fatigue (cumulative tracker for UI)
             state.fatigue = (1.0 - state.hp / state.max_hp) * 100.0
             
-            # Check for finish with precise timing
-            if state.distance >= self.race_distance and not state.is_finished:
+            # Check for finish with precise timing (running Umas only reach
+            # here, so a finished state never re-enters this branch)
+            if state.distance >= race_distance:
                 state.is_finished = True
                 # Calculate exact finish time by interpolation
-                overshoot = state.distance - self.race_distance
+                overshoot = state.distance - race_distance
                 if effective_speed > 0:
                     time_past_finish = overshoot / effective_speed
-                    state.finish_time = self.current_time - time_past_finish
+                    state.finish_time = current_time - time_past_finish
                 else:
-                    state.finish_time = self.current_time
-                state.distance = self.race_distance
+                    state.finish_time = current_time
+                state.distance = race_distance
+                retire_uma(uma_name)
             
-            # Check for DNF
-            self.check_dnf(uma_name)
+            # Check for DNF: only stopped Umas or ones with low-stat risks
+            # can DNF, so skip the call for everyone else
+            elif state.current_speed < 1.0 or dnf_risks.get(uma_name):
+                check_dnf(uma_name)
         
-        # Check if race is finished
-        active_count = sum(
-            1 for s in self.uma_states.values()
-            if not s.is_finished and not s.is_dnf
-        )
-        if active_count == 0:
+        # Check if race is finished (no alive bits left)
+        if not self._alive_bits:
             self.is_finished = True
         
         return self.uma_states
     
-    def get_rankings(self) -> List[Tuple[str, float, bool, bool]]:
+    def get_rankings(self, top_k: Optional[int] = None) -> List[Tuple[str, float, bool, bool]]:
         """
         Get current rankings.
         
+        Args:
+            top_k: Only return the leading top_k Uma (partial selection
+                   instead of a full sort). None = everyone.
+        
         Returns:
             List of (name, distance, is_finished, is_dnf) sorted by distance
         """
@@ -4595,7 +4872,9 @@ class RaceEngine:
             (name, state.distance, state.is_finished, state.is_dnf)
             for name, state in self.uma_states.items()
         ]
-        rankings.sort(key=lambda x: x[1], reverse=True)
+        if top_k is not None:
+            return heapq.nlargest(top_k, rankings, key=_BY_SECOND)
+        rankings.sort(key=_BY_SECOND, reverse=True)
         return rankings
     
     def get_final_results(self) -> List[Tuple[int, str, float, str]]:
@@ -4610,14 +4889,14 @@ class RaceEngine:
             for name, state in self.uma_states.items()
             if state.is_finished
         ]
-        finished.sort(key=lambda x: x[1])
+        finished.sort(key=_BY_SECOND)
         
         dnf = [
             (name, state.distance, f"DNF ({state.dnf_reason})")
             for name, state in self.uma_states.items()
             if state.is_dnf
         ]
-        dnf.sort(key=lambda x: x[1], reverse=True)
+        dnf.sort(key=_BY_SECOND, reverse=True)
         
         results = []
         position = 1
@@ -4635,18 +4914,43 @@ class RaceEngine:
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Config string -> enum maps (built once, shared by every config load)
+# Note: RW (Runaway) is kept for backwards compatibility with old configs.
+# New configs should use FR with Runaway skill instead.
+CONFIG_STYLE_MAP = {
+    'FR': RunningStyle.FR, 'PC': RunningStyle.PC,
+    'LS': RunningStyle.LS, 'EC': RunningStyle.EC,
+    'RW': RunningStyle.RW,
+}
+
+CONFIG_MOOD_MAP = {
+    'AWFUL': Mood.AWFUL,
+    'BAD': Mood.BAD,
+    'NORMAL': Mood.NORMAL,
+    'GOOD': Mood.GOOD,
+    'GREAT': Mood.GREAT,
+}
+
+CONFIG_TRACK_CONDITION_MAP = {
+    'firm': TrackCondition.FIRM,
+    'good': TrackCondition.GOOD,
+    'soft': TrackCondition.SOFT,
+    'heavy': TrackCondition.HEAVY,
+}
+
+CONFIG_TERRAIN_MAP = {
+    'turf': TerrainType.TURF,
+    'dirt': TerrainType.DIRT,
+}
+
+
 def create_uma_stats_from_dict(uma_dict: dict) -> UmaStats:
     """Create UmaStats from a dictionary (e.g., from JSON config)."""
     stats = uma_dict.get('stats', {})
     
     # Parse running style
-    # Note: RW (Runaway) is kept for backwards compatibility with old configs.
-    # New configs should use FR with Runaway skill instead.
     style_str = uma_dict.get('running_style', 'PC').upper()
-    style_map = {'FR': RunningStyle.FR, 'PC': RunningStyle.PC, 
-                 'LS': RunningStyle.LS, 'EC': RunningStyle.EC,
-                 'RW': RunningStyle.RW}
-    running_style = style_map.get(style_str, RunningStyle.PC)
+    running_style = CONFIG_STYLE_MAP.get(style_str, RunningStyle.PC)
     
     # Get aptitudes
     dist_apt = uma_dict.get('distance_aptitude', {})
@@ -4657,21 +4961,13 @@ def create_uma_stats_from_dict(uma_dict: dict) -> UmaStats:
     
     # Parse mood
     mood_str = uma_dict.get('mood', 'Normal').upper()
-    mood_map = {
-        'AWFUL': Mood.AWFUL,
-        'BAD': Mood.BAD,
-        'NORMAL': Mood.NORMAL,
-        'GOOD': Mood.GOOD,
-        'GREAT': Mood.GREAT,
-    }
-    mood = mood_map.get(mood_str, Mood.NORMAL)
+    mood = CONFIG_MOOD_MAP.get(mood_str, Mood.NORMAL)
     
     # Get gate number (1-18, default 1)
     gate_number = uma_dict.get('gate_number', 1)
-    if not isinstance(gate_number, int) or gate_number < 1:
+    if not isinstance(gate_number, int):
         gate_number = 1
-    if gate_number > 18:
-        gate_number = 18
+    gate_number = min(18, max(1, gate_number))
     
     return UmaStats(
         name=uma_dict.get('name', 'Unknown'),
@@ -4701,20 +4997,10 @@ def create_race_engine_from_config(config_data: dict, seed: Optional[int] = None
     
     # Parse track condition (from UmaConfigGenerator)
     track_condition_str = race_info.get('track_condition', 'Good').lower()
-    track_condition_map = {
-        'firm': TrackCondition.FIRM,
-        'good': TrackCondition.GOOD,
-        'soft': TrackCondition.SOFT,
-        'heavy': TrackCondition.HEAVY,
-    }
-    track_condition = track_condition_map.get(track_condition_str, TrackCondition.GOOD)
+    track_condition = CONFIG_TRACK_CONDITION_MAP.get(track_condition_str, TrackCondition.GOOD)
     
     # Parse terrain type from surface
-    terrain_map = {
-        'turf': TerrainType.TURF,
-        'dirt': TerrainType.DIRT,
-    }
-    terrain = terrain_map.get(surface.lower(), TerrainType.TURF)
+    terrain = CONFIG_TERRAIN_MAP.get(surface.lower(), TerrainType.TURF)
     
     # Get stat threshold (for speed bonus when exceeding threshold)
     stat_threshold = race_info.get('stat_threshold', 0)
@@ -23,9 +23,14 @@ Duration (from GameTora):
 - Very Long = ~5.0+ seconds
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, astuple
 from enum import Enum, auto
-from typing import Dict, List, Optional, Callable, Set
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Callable, Set, Tuple
+
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class SkillRarity(Enum):
@@ -93,7 +98,7 @@ class RaceTypeRequirement(Enum):
     LONG = "Long"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SkillEffect:
     """A single effect component of a skill"""
     effect_type: SkillEffectType
@@ -101,7 +106,7 @@ class SkillEffect:
     duration: float = 3.0     # Duration in seconds (0 = instant)
     
 
-@dataclass  
+@dataclass(frozen=True, **_SLOTS)
 class SkillCondition:
     """Activation conditions for a skill"""
     phase: SkillTriggerPhase = SkillTriggerPhase.ANY
@@ -122,14 +127,30 @@ class SkillCondition:
     corner_number: Optional[int] = None   # Specific corner (4 = final corner)
 
 
-@dataclass
+# Shared condition/effect instances: many skills use identical ones, so each
+# Skill keeps a reference to the first equal instance registered
+_CONDITION_POOL: Dict[tuple, SkillCondition] = {}
+_EFFECT_POOL: Dict[tuple, SkillEffect] = {}
+
+
+def _intern_condition(condition: SkillCondition) -> SkillCondition:
+    """Return the shared instance equal to this condition"""
+    return _CONDITION_POOL.setdefault(astuple(condition), condition)
+
+
+def _intern_effect(effect: SkillEffect) -> SkillEffect:
+    """Return the shared instance equal to this effect"""
+    return _EFFECT_POOL.setdefault(astuple(effect), effect)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Skill:
     """Definition of a skill"""
     id: str                              # Unique skill identifier
     name: str                            # Display name
     description: str                     # Skill description
     rarity: SkillRarity                  # Skill rarity
-    effects: List[SkillEffect]           # List of effects
+    effects: Tuple[SkillEffect, ...]     # Effects (lists are converted to a tuple)
     condition: SkillCondition            # Activation conditions
     activation_chance: float = 1.0       # Base activation chance (affected by Wit)
     cooldown: float = 0.0                # Cooldown between activations
@@ -140,9 +161,35 @@ class Skill:
     is_evolved: bool = False             # True for evolved/awakened skills (進化スキル)
     evolved_from: Optional[str] = None   # Original skill ID this evolved from
     uma_specific: Optional[str] = None   # Uma name if this is their unique skill
+    # Classification modifiers (derived from the flags above in __post_init__)
+    _activation_mod: float = field(init=False, repr=False, default=0.0)
+    _effect_mod: float = field(init=False, repr=False, default=1.0)
+    _duration_mod: float = field(init=False, repr=False, default=1.0)
+    
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, 'id', sys.intern(self.id))
+        object.__setattr__(self, 'condition', _intern_condition(self.condition))
+        object.__setattr__(self, 'effects', tuple(_intern_effect(e) for e in self.effects))
+        if self.is_unique:
+            activation_mod = UNIQUE_SKILL_ACTIVATION_RATE
+        elif self.is_inherited:
+            activation_mod = INHERITED_SKILL_ACTIVATION_BONUS
+        else:
+            activation_mod = 0.0
+        if self.is_evolved:
+            effect_mod = EVOLVED_SKILL_EFFECT_MULTIPLIER
+        elif self.is_unique:
+            effect_mod = UNIQUE_SKILL_EFFECT_MULTIPLIER
+        else:
+            effect_mod = 1.0
+        object.__setattr__(self, '_activation_mod', activation_mod)
+        object.__setattr__(self, '_effect_mod', effect_mod)
+        object.__setattr__(self, '_duration_mod',
+                           EVOLVED_SKILL_DURATION_MULTIPLIER if self.is_evolved else 1.0)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActiveSkill:
     """Runtime state for an active skill effect"""
     skill: Skill
@@ -172,38 +219,54 @@ EVOLVED_SKILL_DURATION_MULTIPLIER = 1.3   # 30% longer duration
 # =============================================================================
 # Organized by category following GameTora structure
 
-SKILLS_DATABASE: Dict[str, Skill] = {}
+_SKILL_REGISTRY: Dict[str, Skill] = {}
+# Read-only view of the registry; skills are only added through register_skill
+SKILLS_DATABASE: Mapping[str, Skill] = MappingProxyType(_SKILL_REGISTRY)
+
+# Requirement -> skills usable under it (matching or ANY), in database order.
+# Built on first lookup; cleared whenever a skill is registered.
+_SKILLS_BY_RACE_TYPE: Dict[RaceTypeRequirement, List[Skill]] = {}
+_SKILLS_BY_RUNNING_STYLE: Dict[RunningStyleRequirement, List[Skill]] = {}
+_SKILLS_BY_RARITY: Dict[SkillRarity, List[Skill]] = {}
 
 
 def register_skill(skill: Skill) -> Skill:
     """Register a skill in the database"""
-    SKILLS_DATABASE[skill.id] = skill
+    _SKILL_REGISTRY[skill.id] = skill
+    _SKILLS_BY_RACE_TYPE.clear()
+    _SKILLS_BY_RUNNING_STYLE.clear()
+    _SKILLS_BY_RARITY.clear()
     return skill
 
 
+def _build_requirement_index(index: Dict, requirements, attr: str) -> Dict:
+    """Bucket every skill under its requirement, and ANY skills under all of them"""
+    for requirement in requirements:
+        index[requirement] = []
+    any_requirement = requirements.ANY
+    for skill in SKILLS_DATABASE.values():
+        requirement = getattr(skill.condition, attr)
+        if requirement == any_requirement:
+            for bucket in index.values():
+                bucket.append(skill)
+        else:
+            index[requirement].append(skill)
+    return index
+
+
 def get_skill_activation_modifier(skill: Skill) -> float:
     """Get activation rate modifier based on skill classification"""
-    if skill.is_unique:
-        return UNIQUE_SKILL_ACTIVATION_RATE
-    if skill.is_inherited:
-        return INHERITED_SKILL_ACTIVATION_BONUS
-    return 0.0
+    return skill._activation_mod
 
 
 def get_skill_effect_modifier(skill: Skill) -> float:
     """Get effect multiplier based on skill classification"""
-    if skill.is_evolved:
-        return EVOLVED_SKILL_EFFECT_MULTIPLIER
-    if skill.is_unique:
-        return UNIQUE_SKILL_EFFECT_MULTIPLIER
-    return 1.0
+    return skill._effect_mod
 
 
 def get_skill_duration_modifier(skill: Skill) -> float:
     """Get duration multiplier based on skill classification"""
-    if skill.is_evolved:
-        return EVOLVED_SKILL_DURATION_MULTIPLIER
-    return 1.0
+    return skill._duration_mod
 
 
 # -----------------------------------------------------------------------------
@@ -6309,23 +6372,26 @@ def get_skill_by_id(skill_id: str) -> Optional[Skill]:
 
 def get_skills_by_rarity(rarity: SkillRarity) -> List[Skill]:
     """Get all skills of a specific rarity"""
-    return [s for s in SKILLS_DATABASE.values() if s.rarity == rarity]
+    if not _SKILLS_BY_RARITY:
+        for skill_rarity in SkillRarity:
+            _SKILLS_BY_RARITY[skill_rarity] = []
+        for skill in SKILLS_DATABASE.values():
+            _SKILLS_BY_RARITY[skill.rarity].append(skill)
+    return list(_SKILLS_BY_RARITY.get(rarity, ()))
 
 
 def get_skills_by_running_style(style: RunningStyleRequirement) -> List[Skill]:
     """Get all skills available for a running style (including ANY)"""
-    return [
-        s for s in SKILLS_DATABASE.values() 
-        if s.condition.running_style in (style, RunningStyleRequirement.ANY)
-    ]
+    index = _SKILLS_BY_RUNNING_STYLE or _build_requirement_index(
+        _SKILLS_BY_RUNNING_STYLE, RunningStyleRequirement, 'running_style')
+    return list(index.get(style, index[RunningStyleRequirement.ANY]))
 
 
 def get_skills_by_race_type(race_type: RaceTypeRequirement) -> List[Skill]:
     """Get all skills available for a race type (including ANY)"""
-    return [
-        s for s in SKILLS_DATABASE.values()
-        if s.condition.race_type in (race_type, RaceTypeRequirement.ANY)
-    ]
+    index = _SKILLS_BY_RACE_TYPE or _build_requirement_index(
+        _SKILLS_BY_RACE_TYPE, RaceTypeRequirement, 'race_type')
+    return list(index.get(race_type, index[RaceTypeRequirement.ANY]))
 
 
 def get_all_skill_ids() -> List[str]: